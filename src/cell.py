@@ -1,16 +1,44 @@
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import NamedTuple, Tuple, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from src.maze import Maze
 
-@dataclass
-class Point:
-    """Dataclass that represents position on x,y grid"""
+# Bit flags for Cell.walls
+WALL_LEFT, WALL_TOP, WALL_RIGHT, WALL_BOTTOM = 1, 2, 4, 8
+ALL_WALLS = WALL_LEFT | WALL_TOP | WALL_RIGHT | WALL_BOTTOM
+
+
+def _describe_walls(walls: int) -> str:
+    """Returns the "w" format of a cell with the given walls bitmask"""
+    sides = [
+        side
+        for side, flag in (
+            ("top", WALL_TOP),
+            ("right", WALL_RIGHT),
+            ("bottom", WALL_BOTTOM),
+            ("left", WALL_LEFT),
+        )
+        if walls & flag
+    ]
+    return f"Cell has {len(sides)} walls: " + "".join(f"{side} " for side in sides)
+
+
+# Descriptions of every possible walls bitmask, built once
+WALL_DESCRIPTIONS = tuple(_describe_walls(walls) for walls in range(ALL_WALLS + 1))
+
+
+class Point(NamedTuple):
+    """
+    Represents position on x,y grid. A named tuple rather than a dataclass
+    so building one is a single tuple allocation
+    """
 
     x: int
     y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     """
     Dataclass that represents a line on a grid
@@ -29,66 +57,104 @@ class Line:
         return self.point1, self.point2
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Cell:
     """
-    A dataclass to represent different cells in a maze
+    A dataclass to represent different cells in a maze. The cell is a view
+    onto its maze: wall and visited state live in the maze's flat arrays and
+    coordinates are derived from the maze geometry
 
     Attributes
     -----
+    - maze : Maze
+        Maze that owns the state of the cell
+
+    - col, row : int
+        Position of the cell in the maze
+
     - x1, y1 : int
         Represents bottom-left point of cell. To be used to draw walls
 
     - x2, y2 : int
         Represents top-right point of cell. To be used to draw walls
 
-    - has_{side}_wall: bool
-        Flags to indicate which walls to draw on cell
+    - cx, cy : int
+        Center point of cell, cached when the cell is created. Used to draw moves
+
+    - walls : int
+        Bitmask of WALL_{SIDE} flags to indicate which walls to draw on cell
 
-    - visited : list : Keeps track of which cell has already been added to path in DFS
+    - visited : bool
+        Whether the cell was reached while carving or solving, stored in Maze.visited
 
     """
 
-    x1: int = field(init=False)
-    y1: int = field(init=False)
-    x2: int = field(init=False)
-    y2: int = field(init=False)
-    has_left_wall: bool = True
-    has_top_wall: bool = True
-    has_right_wall: bool = True
-    has_bottom_wall: bool = True
-    visited: bool = False
+    maze: "Maze" = field(repr=False)
+    col: int
+    row: int
+    _index: int = field(init=False, repr=False)
+    cx: int = field(init=False, repr=False)
+    cy: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = self.col * self.maze.num_rows + self.row
+        x1, y1, x2, y2 = self.maze.cell_bounds(self.col, self.row)
+        self.cx = (x1 + x2) // 2
+        self.cy = (y1 + y2) // 2
+
+    @property
+    def walls(self) -> int:
+        return self.maze.walls[self._index]
+
+    @walls.setter
+    def walls(self, value: int) -> None:
+        self.maze.walls[self._index] = value
+
+    @property
+    def visited(self) -> bool:
+        return bool(self.maze.visited[self._index])
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        self.maze.visited[self._index] = value
+
+    @property
+    def x1(self) -> int:
+        return self.maze.x_start + self.col * self.maze.cell_width
+
+    @property
+    def y1(self) -> int:
+        return self.maze.y_start + self.row * self.maze.cell_height
+
+    @property
+    def x2(self) -> int:
+        return self.x1 + self.maze.cell_width
+
+    @property
+    def y2(self) -> int:
+        return self.y1 + self.maze.cell_height
+
+    def _format_walls(self) -> str:
+        return WALL_DESCRIPTIONS[self.walls]
+
+    def _format_visited(self) -> str:
+        return f"Cell is {'visited' if self.visited else 'not visited'}"
+
+    def _format_coords(self) -> str:
+        # Coordinates are always derived from the maze, so cells on the
+        # top/left edge (x1 or y1 of 0) format too
+        return f" with the following coordinates:\nX: {self.cx}\nY: {self.cy}"
+
+    # Maps the first character of a format spec to its formatter
+    _FORMATTERS = {"w": _format_walls, "v": _format_visited, "c": _format_coords}
 
     def __format__(self, format_spec: str):
         """
         Parameters
         ------
-        format_spec : str : takes the following key mappings
+        format_spec : str : the first character picks one of the following
             "w": number of walls belonging to this cell
             "v": indicates if instance has been visited during path generation
             "c": returns cell's coordinates
         """
-        format_spec = set(format_spec)
-        if "w" in format_spec:
-            num_walls = [
-                1 if i else 0
-                for i in [
-                    self.has_left_wall,
-                    self.has_top_wall,
-                    self.has_right_wall,
-                    self.has_bottom_wall,
-                ]
-            ]
-            format_str = f"Cell has {num_walls.count(1)} walls: "
-            for wall in ["top", "right", "bottom", "left"]:
-                if getattr(self, f"has_{wall}_wall"):
-                    format_str += f"{wall} "
-            return format_str
-        if "v" in format_spec:
-            return f"Cell is {self.visited and 'visited' or 'not visited'}"
-        if "c" in format_spec:
-            if self.x1 and self.y1 and self.x2 and self.y2:
-                center_x_source = (self.x1 + self.x2) // 2
-                center_y_source = (self.y1 + self.y2) // 2
-                return f" with the following coordinates:\nX: {center_x_source}\nY: {center_y_source}"
-        return self.__repr__()
+        return self._FORMATTERS.get(format_spec[:1], Cell.__repr__)(self)
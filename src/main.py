@@ -6,7 +6,6 @@ from src.screen import App
 def main():
     root = Tk()
     app = App(master=root)
-    app.start()
     app.wait_for_close()
 
 
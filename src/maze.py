@@ -1,12 +1,37 @@
-import time
 import random
-from typing import Tuple, List
-from dataclasses import dataclass
-
-from src.cell import Cell, Line, Point
-
-
-@dataclass
+from collections import deque
+from itertools import permutations
+from typing import Generator, Iterator, Tuple, List
+from dataclasses import dataclass, field
+
+from src.cell import (
+    ALL_WALLS,
+    Cell,
+    WALL_BOTTOM,
+    WALL_LEFT,
+    WALL_RIGHT,
+    WALL_TOP,
+)
+
+# Corners of the wall on each side of a cell, as indices into (x1, y1, x2, y2)
+WALL_SEGMENTS = {
+    WALL_TOP: (0, 1, 2, 1),
+    WALL_RIGHT: (2, 1, 2, 3),
+    WALL_BOTTOM: (2, 3, 0, 3),
+    WALL_LEFT: (0, 3, 0, 1),
+}
+# Column and row offset of the neighbor behind each wall, and the wall it shares
+NEIGHBOR_OFFSETS = {
+    WALL_TOP: (0, -1, WALL_BOTTOM),
+    WALL_RIGHT: (1, 0, WALL_LEFT),
+    WALL_BOTTOM: (0, 1, WALL_TOP),
+    WALL_LEFT: (-1, 0, WALL_RIGHT),
+}
+# Every order the four walls can be walked in, to pick one at random
+DIRECTION_ORDERS = tuple(permutations((WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT)))
+
+
+@dataclass(slots=True)
 class Maze:
     """
     Data class for Maze structure
@@ -34,6 +59,12 @@ class Maze:
     - cells : list[list[Cell]]
         List of cells in the maze
 
+    - walls : bytearray
+        Wall bitmask of every cell, indexed by col * num_rows + row
+
+    - visited : bytearray
+        Visited flag of every cell, indexed by col * num_rows + row
+
     - start_cell : Cell
         Cell where the maze runner starts
 
@@ -42,8 +73,11 @@ class Maze:
 
     Methods
     -----
-    - get_neighbor_coords(col: int, row: int, direction: str) -> Tuple[Tuple[int, int], str]
-        Returns the coordinates of the neighbor cell and the direction of the wall that connects them
+    - init_cells -> None
+        Allocates the wall and visited arrays and the matrix of cells viewing them
+
+    - cell_bounds(col: int, row: int) -> Tuple[int, int, int, int]
+        Returns the corner coordinates of the cell at the specified column and row
 
     - get_cell(col: int, row: int) -> Cell
         Returns the cell at the specified column and row
@@ -59,6 +93,8 @@ class Maze:
     cell_width: int
     cell_height: int
     cells: List[List[Cell]]
+    walls: bytearray = field(default_factory=bytearray, repr=False)
+    visited: bytearray = field(default_factory=bytearray, repr=False)
 
     def __format__(self, format_spec: str) -> str:
         match format_spec:
@@ -81,6 +117,21 @@ class Maze:
             return None
         return self.cells[self.num_cols - 1][self.num_rows - 1]
 
+    def init_cells(self) -> None:
+        """Allocates a fully walled, unvisited maze and the cells viewing it"""
+        self.walls = bytearray([ALL_WALLS]) * (self.num_cols * self.num_rows)
+        self.visited = bytearray(self.num_cols * self.num_rows)
+        self.cells = [
+            [Cell(self, col, row) for row in range(self.num_rows)]
+            for col in range(self.num_cols)
+        ]
+
+    def cell_bounds(self, col: int, row: int) -> Tuple[int, int, int, int]:
+        """Returns (x1, y1, x2, y2) of the cell at the specified column and row"""
+        x1 = self.x_start + col * self.cell_width
+        y1 = self.y_start + row * self.cell_height
+        return x1, y1, x1 + self.cell_width, y1 + self.cell_height
+
     def get_cell(self, col: int, row: int) -> Cell | None:
         """
         Returns the cell at the specified row and column.
@@ -91,33 +142,9 @@ class Maze:
         else:
             return None
 
-    def get_neighbor_coords(
-        self, col: int, row: int, direction: str
-    ) -> Tuple[Tuple[int, int], str]:
-        """
-        Dictionary to map direction to neighbor coordinates and opposite wall
-        -----
-        adjacent_cells = {
-            "top": ((col, row - 1, ), "bottom"),
-            "right": ((col + 1, row), "left"),
-            "bottom": ((col, row + 1), "top"),
-            "left": ((col - 1, row), "right"),
-        }
-        return adjacent_cells[direction]
-        """
-        adjacent_cells = {
-            "top": ((col, row - 1), "bottom"),
-            "right": ((col + 1, row), "left"),
-            "bottom": ((col, row + 1), "top"),
-            "left": ((col - 1, row), "right"),
-        }
-        return adjacent_cells[direction]
-
     def reset_visited_cells(self):
         """Sets all cells in matrix to unvisited"""
-        for col in range(self.num_cols):
-            for row in range(self.num_rows):
-                self.cells[col][row].visited = False
+        self.visited[:] = bytes(len(self.visited))
 
 
 class MazeDrawer:
@@ -130,16 +157,22 @@ class MazeDrawer:
 
     - _canvas : CanvasFrame
 
+    - _rng : random.Random
+        Random number generator used to carve the maze, seeded by the optional seed argument
+
+    - _path_id, _path_coords : int | None, list[int]
+        Canvas line tracing the solver's path, and its points
+
     Methods:
     ----
     - _init_cells
-        Initializes the matrix with Cell objects
+        Initializes the maze's wall and visited arrays and its matrix of cells
 
     - _create_cells
-        Initializes the matrix of cells and draws them to screen
+        Validates the dimensions of the matrix of cells and draws its full grid of walls
 
-    - _draw_cell(i: int, j: int)
-        Draws a cell to screen at specified row/column position
+    - _erase_wall(col: int, row: int, wall: int)
+        Erases a single carved wall of a cell from the screen
 
     - _animate
         Animates maze by drawing cells one at a time and allows us to visulize our algorithm
@@ -148,86 +181,83 @@ class MazeDrawer:
         Draws entrance and exit to maze by removing the top wall of the first cell and
         the bottom wall of the last cell
 
-    - _break_walls_r(col : int, row : int)
-        Recursive backtracking algorithm to create maze
+    - _break_walls(col : int, row : int)
+        Iterative backtracking algorithm to create maze
+
+    - _shuffled_directions() -> Iterator[int]
+        Returns the four WALL_{SIDE} flags in a random order
 
-    - draw_move(from_cell: Cell, to_cell: Cell, undo: bool = False) -> None:
-        Draws a line to indicate the path between two cells
+    - clear_path() -> None:
+        Forgets the line drawn for a previous solve so the next move starts a new one
+
+    - draw_move(from_cell: Cell, to_cell: Cell) -> int:
+        Extends the line indicating the path between two cells
 
     """
 
-    def __init__(self, maze: Maze, frame: "CanvasFrame"):
+    __slots__ = (
+        "_maze",
+        "_canvas",
+        "_rng",
+        "_path_id",
+        "_path_coords",
+    )
+
+    def __init__(self, maze: Maze, frame: "CanvasFrame", seed: int | None = None):
         self._maze = maze
         self._canvas = frame
+        self._rng = random.Random(seed)
+        self.clear_path()
 
         self._init_cells()
         self._create_cells()
         self._create_entrance_and_exit()
-        self._break_walls_r(0, 0)
+        self._break_walls(0, 0)
+        self._canvas.force_flush()
         self._maze.reset_visited_cells()
 
     def _init_cells(self) -> None:
         """Initializes the matrix of a maze"""
-        new_cells = [
-            [Cell() for _ in range(self._maze.num_rows)]
-            for _ in range(self._maze.num_cols)
-        ]
-        self._maze.cells = new_cells
+        self._maze.init_cells()
 
     def _create_cells(self) -> None:
-        """Draws matrix of cells to draw to screen"""
+        """
+        Validates the matrix of cells and draws it as a full grid. Every wall
+        starts out standing, so the grid is one line per column and row edge
+        rather than four walls per cell; carving then only erases walls
+        """
 
         if self._maze.num_cols <= 0 or self._maze.num_rows <= 0:
             raise ValueError("Maze must have a positive number of rows and columns")
-        for i in range(self._maze.num_cols):
-            for j in range(self._maze.num_rows):
-                x1 = self._maze.x_start + i * self._maze.cell_width
-                y1 = self._maze.y_start + j * self._maze.cell_height
-                x2 = x1 + self._maze.cell_width
-                y2 = y1 + self._maze.cell_height
-                self._maze.cells[i][j].x1 = x1
-                self._maze.cells[i][j].y1 = y1
-                self._maze.cells[i][j].x2 = x2
-                self._maze.cells[i][j].y2 = y2
-
-    def _draw_cell(self, x: int, y: int) -> None:
+
+        maze = self._maze
+        x_start, y_start = maze.x_start, maze.y_start
+        cell_width, cell_height = maze.cell_width, maze.cell_height
+        x_end = x_start + maze.num_cols * cell_width
+        y_end = y_start + maze.num_rows * cell_height
+        queue_wall = self._canvas.queue_wall
+        for x in range(x_start, x_end + 1, cell_width):
+            queue_wall(x, y_start, x, y_end)
+        for y in range(y_start, y_end + 1, cell_height):
+            queue_wall(x_start, y, x_end, y)
+        self._animate()
+
+    def _erase_wall(self, col: int, row: int, wall: int) -> None:
         """
-        Draws a single cell on the canvas.
+        Erases a single wall of a cell from the canvas
 
         Parameters
         ----------
-        x : int
+        col : int
             The column index of the cell.
-        y : int
+        row : int
             The row index of the cell.
+        wall : int
+            The WALL_{SIDE} flag of the wall to erase.
         """
-
-        cell = self._maze.cells[x][y]
-
-        top_left_corner = (cell.x1, cell.y1)
-        top_right_corner = (cell.x2, cell.y1)
-        bottom_right_corner = (cell.x2, cell.y2)
-        bottom_left_corner = (cell.x1, cell.y2)
-
-        # Dictionary containing the coordinates of the wall's corners
-        wall_directions = {
-            "top": (top_left_corner, top_right_corner),
-            "right": (top_right_corner, bottom_right_corner),
-            "bottom": (bottom_right_corner, bottom_left_corner),
-            "left": (bottom_left_corner, top_left_corner),
-        }
-
-        for direction in wall_directions:
-            fill_color = (
-                "white" if not getattr(cell, f"has_{direction}_wall") else "black"
-            )
-
-            point1 = wall_directions[direction][0]
-            point2 = wall_directions[direction][1]
-            wall_line = Line(Point(*point1), Point(*point2))
-            self._canvas.draw_line(wall_line, fill_color)
-
-        self._animate()
+        bounds = self._maze.cell_bounds(col, row)
+        a, b, c, d = WALL_SEGMENTS[wall]
+        self._canvas.queue_wall(bounds[a], bounds[b], bounds[c], bounds[d], "white")
 
     def _animate(self, path: bool = False) -> None:
         """
@@ -237,13 +267,14 @@ class MazeDrawer:
         -----
         - path ?: bool : Flag to indicate if method was called to draw cells or path.
             Defaults to False
-            Used to determine time to sleep while redrawing
+            Path steps are painted immediately, cell draws are coalesced into
+            frames. Nothing sleeps here: the pace of the solver animation is
+            set by the Tk event loop (see CanvasFrame._solve_step)
         """
-        self._canvas.parent_frame.update_canvas()
         if path:
-            time.sleep(0.1)
+            self._canvas.force_flush()
         else:
-            pass
+            self._canvas.request_redraw()
 
     def _create_entrance_and_exit(self) -> None:
         """Creates entrance and exit to maze by removing the top wall of the first cell and
@@ -253,50 +284,66 @@ class MazeDrawer:
             self._maze.num_cols - 1,
             self._maze.num_rows - 1,
         )
-        top_cell.has_top_wall = False
-        bottom_cell.has_bottom_wall = False
-        top_cell.visited = True
-
-        self._draw_cell(0, 0)
-        self._draw_cell(self._maze.num_cols - 1, self._maze.num_rows - 1)
+        top_cell.walls &= ~WALL_TOP
+        bottom_cell.walls &= ~WALL_BOTTOM
+        self._erase_wall(0, 0, WALL_TOP)
+        self._erase_wall(bottom_cell.col, bottom_cell.row, WALL_BOTTOM)
 
-    def _break_walls_r(self, col: int, row: int) -> None:
+    def _break_walls(self, col: int, row: int) -> None:
         """
         Uses a depth-first approach to setting the walls of the maze.
         This method is used to break the walls of the maze in a random order and set every cell to visited.
+        The depth-first walk keeps its own stack of (col, row, remaining directions)
+        rather than recursing, so maze size is not bound by the recursion limit
         """
-        current_cell: Cell = self._maze.get_cell(col, row)
-        current_cell.visited = True
+        maze = self._maze
+        walls, visited = maze.walls, maze.visited
+        num_cols, num_rows = maze.num_cols, maze.num_rows
+        erase_wall, animate = self._erase_wall, self._animate
+        shuffled_directions = self._shuffled_directions
 
-        directions = ["top", "right", "bottom", "left"]
-        random.shuffle(directions)
+        visited[col * num_rows + row] = True
+        stack = [(col, row, shuffled_directions())]
 
-        for direction in directions:
-            neighbor_coords, opposite_direction = self._maze.get_neighbor_coords(
-                col, row, direction
-            )
-            neighbor_col, neighbor_row = neighbor_coords
+        while stack:
+            col, row, directions = stack[-1]
+            wall = next(directions, None)
+            if wall is None:
+                stack.pop()
+                continue
 
-            if (
-                0 <= neighbor_row < self._maze.num_rows
-                and 0 <= neighbor_col < self._maze.num_cols
-            ):
-                neighbor = self._maze.get_cell(*neighbor_coords)
+            col_offset, row_offset, opposite_wall = NEIGHBOR_OFFSETS[wall]
+            neighbor_col, neighbor_row = col + col_offset, row + row_offset
 
-                if neighbor and not neighbor.visited:
+            if 0 <= neighbor_row < num_rows and 0 <= neighbor_col < num_cols:
+                neighbor_index = neighbor_col * num_rows + neighbor_row
+
+                if not visited[neighbor_index]:
                     # Break the wall between current cell and neighbor
-                    setattr(current_cell, f"has_{direction}_wall", False)
-                    setattr(neighbor, f"has_{opposite_direction}_wall", False)
+                    walls[col * num_rows + row] &= ~wall
+                    walls[neighbor_index] &= ~opposite_wall
+                    erase_wall(col, row, wall)
+                    animate()
+
+                    # Continue the walk from the neighbor cell
+                    visited[neighbor_index] = True
+                    stack.append((neighbor_col, neighbor_row, shuffled_directions()))
 
-                    # Recursively call the function for the neighbor cell
-                    self._break_walls_r(*neighbor_coords)
-            self._draw_cell(col, row)
+    def _shuffled_directions(self) -> Iterator[int]:
+        """Returns an iterator over the four WALL_{SIDE} flags in a random order"""
+        return iter(DIRECTION_ORDERS[self._rng.randrange(len(DIRECTION_ORDERS))])
 
-    def draw_move(self, from_cell: Cell, to_cell: "Cell", undo: bool = False) -> int:
+    def clear_path(self) -> None:
+        """Forgets the path line of a previous solve; the next move starts a new one"""
+        self._path_id = None
+        self._path_coords = []
+
+    def draw_move(self, from_cell: Cell, to_cell: "Cell") -> int:
         """
         Draws a line connecting two cells on the canvas.
-        If undo is True, the line will backtrack
-        Returns id created from self._canvas.create_line to be able to delete it later
+        The solver's path is a single gray polyline that grows with each move,
+        instead of one canvas item per move
+        Returns id of the canvas line that was changed to be able to delete it later
 
         Parameters
         ----------
@@ -304,28 +351,16 @@ class MazeDrawer:
             The starting cell from which the line should be drawn.
         to_cell : Cell
             The destination cell to which the line should be drawn.
-        undo : bool, optional
-            Indicates whether the line should be removed (backtracking), by default False.
         """
-        if not isinstance(to_cell, Cell) or not isinstance(from_cell, Cell):
-            raise ValueError("Invalid cell instance")
-
-        line_color = "gray"
-        if undo:
-            line_color = "red"
-
-        center_x_source = (from_cell.x1 + from_cell.x2) // 2
-        center_y_source = (from_cell.y1 + from_cell.y2) // 2
-
-        center_x_destination = (to_cell.x1 + to_cell.x2) // 2
-        center_y_destination = (to_cell.y1 + to_cell.y2) // 2
-
-        line = Line(
-            Point(center_x_source, center_y_source),
-            Point(center_x_destination, center_y_destination),
-        )
-        line_id = self._canvas.draw_line(line, fill_color=line_color)
-        return line_id
+        if self._path_id is None:
+            self._path_coords = [from_cell.cx, from_cell.cy, to_cell.cx, to_cell.cy]
+            self._path_id = self._canvas.draw_line_raw(
+                *self._path_coords, fill_color="gray"
+            )
+        else:
+            self._path_coords += [to_cell.cx, to_cell.cy]
+            self._canvas.set_line_coords(self._path_id, self._path_coords)
+        return self._path_id
 
 
 class MazeSolver:
@@ -340,77 +375,100 @@ class MazeSolver:
     - _drawer : MazeDrawer
         The maze drawer object.
 
+    - solution : set[int]
+        Ids of the canvas lines drawn by the last solve, to delete them on reset.
+
     Methods
     -------
-    - _dfs_r(col: int, row: int) -> bool:
-        Performs depth-first search to find the end of the maze.
+    - _bfs() -> Generator[None, None, bool]:
+        Performs breadth-first search to find the end of the maze, then draws the path one move per step.
+
+    - steps() -> Generator[None, None, bool]:
+        Starts a new solve and yields after every move drawn to the canvas.
 
     - solve() -> bool:
-        Solves the maze using depth-first traversal to find the exit path.
+        Solves the maze using breadth-first traversal to find the shortest exit path.
     """
 
+    __slots__ = ("_maze", "_drawer", "solution")
+
     def __init__(self, maze: Maze, md: MazeDrawer):
         self._maze = maze
         self._drawer = md
+        self.solution = set()
 
-    def _dfs_r(self, col: int, row: int) -> bool:
+    def _bfs(self) -> Generator[None, None, bool]:
         """
-        The _dfs_r method returns True if the current cell is an end cell,
-        OR if it leads to the end cell. It returns False if the current cell is a loser cell.
+        Searches the maze breadth-first from the first cell, recording the cell
+        each one was reached from. Once the end cell is reached, the shortest
+        path is walked back through those parents and drawn, yielding after
+        every move. Returns False if the end cell can't be reached
         """
 
-        current_cell = self._maze.get_cell(col, row)
-        current_cell.visited = True
+        maze = self._maze
+        walls, visited, cells = maze.walls, maze.visited, maze.cells
+        num_cols, num_rows = maze.num_cols, maze.num_rows
+        end = (num_cols - 1) * num_rows + num_rows - 1
+
+        # parents[index] is the index of the cell the search came from
+        parents = {0: None}
+        visited[0] = True
+        queue = deque([(0, 0)])
+
+        while queue:
+            col, row = queue.popleft()
+            index = col * num_rows + row
+            if index == end:
+                break
+
+            for wall, (col_offset, row_offset, _) in NEIGHBOR_OFFSETS.items():
+                if walls[index] & wall:
+                    continue
+                neighbor_col, neighbor_row = col + col_offset, row + row_offset
+
+                # Boundary check, the entrance and exit open onto the edge
+                if 0 <= neighbor_row < num_rows and 0 <= neighbor_col < num_cols:
+                    neighbor_index = neighbor_col * num_rows + neighbor_row
+                    if not visited[neighbor_index]:
+                        visited[neighbor_index] = True
+                        parents[neighbor_index] = index
+                        queue.append((neighbor_col, neighbor_row))
+        else:
+            return False
 
-        if current_cell is self._maze.end_cell:
-            return True
+        path = [end]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
 
-        directions = ["top", "right", "bottom", "left"]
-        random.shuffle(directions)
+        draw_move = self._drawer.draw_move
+        for from_index, to_index in zip(path, path[1:]):
+            from_cell = cells[from_index // num_rows][from_index % num_rows]
+            to_cell = cells[to_index // num_rows][to_index % num_rows]
+            self.solution.add(draw_move(from_cell, to_cell))
+            yield
 
-        for direction in directions:
-            neighbor_coords, opposite_direction = self._maze.get_neighbor_coords(
-                col, row, direction
-            )
+        return True
 
-            neighbor_col, neighbor_row = neighbor_coords
-
-            # Boundary check
-            if (
-                0 <= neighbor_row < self._maze.num_rows
-                and 0 <= neighbor_col < self._maze.num_cols
-            ):
-                neighbor = self._maze.get_cell(*neighbor_coords)
-                # If the neighbor hasn't been visited, and it doesn't have a wall in the opposite direction, then we can move to it
-                if (
-                    neighbor
-                    and not neighbor.visited
-                    and not getattr(neighbor, f"has_{opposite_direction}_wall")
-                ):
-                    # draw move to neighbor
-                    line_id = self._drawer.draw_move(current_cell, neighbor)
-                    self.solution.add(line_id)
-                    self._drawer._animate(path=True)
-                    if self._dfs_r(*neighbor_coords):
-                        # if neighbor is last cell, return True
-                        return True
-                    else:
-                        # if neighbor is not last cell, recursively backtrack
-                        line_id = self._drawer.draw_move(
-                            neighbor, current_cell, undo=True
-                        )
-                        self.solution.add(line_id)
-                        self._drawer._animate(path=True)
-
-                    self._dfs_r(*neighbor_coords)
-
-        return False
+    def steps(self) -> Generator[None, None, bool]:
+        """
+        Starts a new solve from the first cell. The returned generator yields
+        after every move drawn and returns True once the exit is found, so the
+        caller can schedule each step from the Tk event loop
+        """
+        self.solution = set()
+        self._drawer.clear_path()
+        return self._bfs()
 
     def solve(self) -> bool:
         """
-        Solves maze using depth-first search to find exit path
-        Calls self._dfs_r from the first cell
-        return self._dfs_r(0, 0)
+        Solves maze using breadth-first search to find the shortest exit path
+        Runs every step of self.steps() to completion, animating each one
         """
-        self.solution = set()
-        return self._dfs_r(0, 0)
+        solver = self.steps()
+        while True:
+            try:
+                next(solver)
+            except StopIteration as done:
+                return done.value
+            self._drawer._animate(path=True)
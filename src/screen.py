@@ -6,20 +6,28 @@ from tkinter import (
     Entry,
     Label,
     Canvas,
+    PhotoImage,
     DISABLED,
     NORMAL,
     TclError,
     Event,
 )
 from tkinter.messagebox import showerror
+from array import array
 from enum import Enum
-from typing import Tuple, Callable, Optional
+from time import monotonic
+from typing import Dict, Tuple, Callable, List, Optional
 
 
 from src.maze import Maze, MazeDrawer, MazeSolver
 from src.cell import Line
 
 WINDOW_SIZE = 800
+# Pending draws are painted once this many pile up or a frame has elapsed
+REDRAW_BATCH = 32
+FRAME_TIME = 0.016
+# Delay between animated solver moves
+SOLVE_STEP_MS = 100
 
 
 class CanvasState(Enum):
@@ -41,9 +49,6 @@ class App:
 
     Methods
     -------
-    - start() -> None:
-        Starts the Tkinter window main loop.
-
     - close() -> None:
         Terminates the window.
 
@@ -51,7 +56,7 @@ class App:
         Checks if the window is still open.
 
     - wait_for_close() -> None:
-        Waits for the window to close before redrawing.
+        Hands control to the Tk event loop until the window is closed.
     """
 
     def __init__(self, master: Tk):
@@ -67,26 +72,23 @@ class App:
     def root(self):
         return self.__root
 
-    def start(self) -> None:
-        self.__root.mainloop()
-
     def close(self) -> None:
         self.__root.destroy()
 
     def is_valid_window(self) -> bool:
         """Method that checks if window is still open before drawing to it"""
         try:
-            return self.__root.winfo_exists()
+            return bool(self.__root.winfo_exists())
         except TclError:
-            pass
+            return False
 
     def wait_for_close(self) -> None:
-        """Method that checks if window is still open before drawing to it"""
-        try:
-            while self.is_valid_window():
-                self.config.update_canvas()
-        except TclError:
-            pass
+        """
+        Blocks in the Tk event loop until the window is closed so Tk can idle
+        between events instead of spinning on redraws
+        """
+        if self.is_valid_window():
+            self.__root.mainloop()
 
 
 class AppConfig(Frame):
@@ -182,11 +184,14 @@ class AppConfig(Frame):
             self.toggle_button_state(action, False)
 
     def update_canvas(self) -> None:
+        """
+        Flushes pending redraws while the canvas is busy. Only idle tasks are
+        processed so drawing never re-enters the event loop
+        """
         if self.canvas_state != CanvasState.IDLE:
             self.app.root.update_idletasks()
-            self.app.root.update()
 
-    def toggle_button_state(self, button_text: str, state: bool):
+    def toggle_button_state(self, button_text: str, state: Optional[bool] = None):
         """
         Explictly set button state. If no state is passed, toggle the button's
         current state.
@@ -203,8 +208,10 @@ class AppConfig(Frame):
         if btn is None:
             raise ValueError("Invalid button text")
 
+        if state is not None:
+            btn["state"] = NORMAL if state else DISABLED
         # Only togglable when canvas is idle
-        if self.canvas_state == CanvasState.IDLE:
+        elif self.canvas_state == CanvasState.IDLE:
             btn["state"] = NORMAL if btn["state"] == DISABLED else DISABLED
 
 
@@ -223,6 +230,9 @@ class CanvasFrame(Frame):
     - canvas : Canvas
         The Tkinter canvas instance.
 
+    - wall_image : PhotoImage
+        Image covering the canvas that maze walls are painted onto.
+
     - canvas_state : CanvasState
         The state of the canvas.
 
@@ -234,8 +244,11 @@ class CanvasFrame(Frame):
     - _validate_input() -> Tuple[int, int]:
         Validates the input of rows and columns.
 
-    - _calculate_padding(num_cols: int, num_rows: int) -> Tuple[int, int]:
-        Calculates the padding around the maze based on the number of rows and columns.
+    - _calculate_cell_size(num_cols: int, num_rows: int) -> Tuple[int, int]:
+        Calculates the size of each cell based on the number of rows and columns.
+
+    - _calculate_padding(num_cols: int, num_rows: int, cell_width: int, cell_height: int) -> Tuple[int, int]:
+        Calculates the padding around the maze based on its dimensions.
 
     - _bind_return(func: Callable) -> None:
         Binds the return key to a function.
@@ -252,11 +265,38 @@ class CanvasFrame(Frame):
     - draw_line(line: Line, fill_color="black") -> int:
         Draws a line on the canvas.
 
+    - draw_line_raw(x1: int, y1: int, x2: int, y2: int, fill_color="black") -> int:
+        Draws a line on the canvas from its endpoint coordinates.
+
+    - set_line_coords(line_id: int, coords: List[int]) -> None:
+        Moves the points of a line already on the canvas.
+
+    - queue_wall(x1: int, y1: int, x2: int, y2: int, fill_color="black") -> None:
+        Buffers an axis-aligned wall to be painted on the next flush.
+
+    - flush() -> None:
+        Paints every buffered wall onto the wall image in a single Tcl evaluation.
+
+    - request_redraw() -> None:
+        Paints pending draws once enough have accumulated or a frame has elapsed.
+
+    - force_flush() -> None:
+        Paints every pending draw immediately.
+
     - draw_maze(event=None) -> None:
         Draws the maze based on user input.
 
     - solve_maze(event=None) -> None:
-        Solves the maze.
+        Solves the maze, animating one move per SOLVE_STEP_MS from the Tk event loop.
+
+    - _solve_step() -> None:
+        Runs the next move of the solver and schedules the one after it.
+
+    - _cancel_solve() -> None:
+        Stops an animated solve that is still running.
+
+    - _finish_solve() -> None:
+        Returns the canvas to idle once the solver is done.
 
     - reset_maze(event=None) -> None:
         Resets the maze.
@@ -267,13 +307,23 @@ class CanvasFrame(Frame):
         self.parent_frame = parent_frame
         self.maze = None
         self.canvas = None
+        self.wall_image = None
         self.canvas_state = self.parent_frame.canvas_state
+        # Buffered wall regions, four ints each, grouped by fill color
+        self._pending: Dict[str, array] = {}
+        self._solver_steps = None
+        self._solve_after_id = None
+        self._dirty_count = 0
+        self._last_flush = monotonic()
 
         self.create_canvas()
         self._bind_return(self.draw_maze)
 
     def _clear_canvas(self):
+        self._pending.clear()
         self.canvas.delete("all")
+        self.wall_image.blank()
+        self.canvas.create_image((0, 0), image=self.wall_image, anchor="nw")
 
     def _validate_input(self) -> Tuple[int, int]:
         """
@@ -283,13 +333,24 @@ class CanvasFrame(Frame):
         try:
             cols_entry = int(self.parent_frame.col_input.get())
             rows_entry = int(self.parent_frame.row_input.get())
-            if cols_entry < 2 or cols_entry > 50 or rows_entry < 2 or rows_entry > 50:
+            if not (2 <= cols_entry <= 50 and 2 <= rows_entry <= 50):
                 raise ValueError("Maze must have between 2 and 50 columns")
             return cols_entry, rows_entry
         except ValueError:
             raise ValueError("Please enter valid numeric values for rows and columns.")
 
-    def _calculate_padding(self, num_cols: int, num_rows: int) -> Tuple[int, int]:
+    def _calculate_cell_size(self, num_cols: int, num_rows: int) -> Tuple[int, int]:
+        """
+        Takes user input of columns and rows to calculate the size of each cell
+        Returns cell width and height : Tuple[int, int]
+        """
+        cell_width = 20 if num_cols < 25 else 10
+        cell_height = 20 if num_rows < 25 else 10
+        return (cell_width, cell_height)
+
+    def _calculate_padding(
+        self, num_cols: int, num_rows: int, cell_width: int, cell_height: int
+    ) -> Tuple[int, int]:
         """
         Takes user input of columns and rows to calculate how much padding to put around the maze
         Returns padding value for x and y : Tuple[int, int]
@@ -300,15 +361,13 @@ class CanvasFrame(Frame):
             Number of columns in the maze
         - num_rows: int
             Number of rows in the maze
+        - cell_width: int
+            Width of each cell in the maze
+        - cell_height: int
+            Height of each cell in the maze
         """
-        cell_cols = 20 if num_rows < 25 else 10
-        cell_rows = 20 if num_cols < 25 else 10
-
-        maze_width = num_rows * cell_cols
-        maze_height = num_cols * cell_rows
-
-        padding_x = (WINDOW_SIZE - maze_width) / 2
-        padding_y = (WINDOW_SIZE - maze_height) / 2
+        padding_x = (WINDOW_SIZE - num_cols * cell_width) // 2
+        padding_y = (WINDOW_SIZE - num_rows * cell_height) // 2
 
         return (padding_x, padding_y)
 
@@ -327,35 +386,118 @@ class CanvasFrame(Frame):
     def create_canvas(self):
         self.canvas = Canvas(self, bg="white")
         self.canvas.pack(fill=BOTH, expand=True)
+        # Walls are axis-aligned, so they are painted as pixels on one image
+        # rather than kept as thousands of canvas line items
+        self.wall_image = PhotoImage(
+            master=self.canvas, width=WINDOW_SIZE, height=WINDOW_SIZE
+        )
+        self.canvas.create_image((0, 0), image=self.wall_image, anchor="nw")
 
     def draw_line(self, line: Line, fill_color="black") -> int:
         """Draws line to canvas and returns id created from Canvas.create_line"""
+        point1, point2 = line.get_points()
+        return self.draw_line_raw(point1.x, point1.y, point2.x, point2.y, fill_color)
+
+    def draw_line_raw(
+        self, x1: int, y1: int, x2: int, y2: int, fill_color="black"
+    ) -> int:
+        """Same as draw_line, but takes the endpoint coordinates directly"""
         if self.parent_frame.canvas_state in [CanvasState.DRAWING, CanvasState.SOLVING]:
-            point1, point2 = line.get_points()
-            x1, y1 = point1.x, point1.y
-            x2, y2 = point2.x, point2.y
+            self._dirty_count += 1
             return self.canvas.create_line(x1, y1, x2, y2, fill=fill_color, width=2)
 
+    def set_line_coords(self, line_id: int, coords: List[int]) -> None:
+        """Replaces the points of a line already on the canvas"""
+        if self.parent_frame.canvas_state in [CanvasState.DRAWING, CanvasState.SOLVING]:
+            self._dirty_count += 1
+            self.canvas.coords(line_id, *coords)
+
+    @staticmethod
+    def _wall_region(
+        x1: int, y1: int, x2: int, y2: int, fill_color: str
+    ) -> Tuple[int, int, int, int]:
+        """
+        Returns the 2px wide pixel region covered by an axis-aligned wall.
+        Drawn walls overlap the corner posts they meet; erased walls stop
+        short of them so neighbouring walls are left intact
+        """
+        left, right = sorted((int(x1), int(x2)))
+        top, bottom = sorted((int(y1), int(y2)))
+        pad = 1 if fill_color != "white" else -1
+        if left == right:
+            return left - 1, top - pad, left + 1, bottom + pad
+        return left - pad, top - 1, right + pad, top + 1
+
+    def queue_wall(
+        self, x1: int, y1: int, x2: int, y2: int, fill_color="black"
+    ) -> None:
+        """Buffers an axis-aligned wall to be painted on the next call to flush"""
+        if self.parent_frame.canvas_state in [CanvasState.DRAWING, CanvasState.SOLVING]:
+            regions = self._pending.get(fill_color)
+            if regions is None:
+                regions = self._pending[fill_color] = array("i")
+            regions.extend(self._wall_region(x1, y1, x2, y2, fill_color))
+            self._dirty_count += 1
+
+    def flush(self) -> None:
+        """
+        Paints every buffered wall onto the wall image with a single Tcl
+        evaluation. Black walls are issued before white ones: a wall is only
+        ever erased after it is drawn, so erasures still land on top within
+        a batch
+        """
+        if not self._pending:
+            return
+        image = str(self.wall_image)
+        commands = []
+        for color in sorted(self._pending, key=lambda color: color == "white"):
+            corners = iter(self._pending[color])
+            commands += [
+                f"{image} put {color} -to {x1} {y1} {x2} {y2}"
+                for x1, y1, x2, y2 in zip(corners, corners, corners, corners)
+            ]
+        self._pending.clear()
+        self.canvas.tk.eval("\n".join(commands))
+
+    def request_redraw(self) -> None:
+        """
+        Coalesces redraws: pending draws are only painted once REDRAW_BATCH
+        of them pile up or FRAME_TIME has passed since the last paint
+        """
+        if (
+            self._dirty_count >= REDRAW_BATCH
+            or monotonic() - self._last_flush >= FRAME_TIME
+        ):
+            self.force_flush()
+
+    def force_flush(self) -> None:
+        """Paints every pending draw to the screen immediately"""
+        self.flush()
+        self.parent_frame.update_canvas()
+        self._dirty_count = 0
+        self._last_flush = monotonic()
+
     def draw_maze(self, event: Optional[Event] = None):
         try:
             num_cols, num_rows = self._validate_input()
-            padding_x, padding_y = self._calculate_padding(num_cols, num_rows)
+            cell_width, cell_height = self._calculate_cell_size(num_cols, num_rows)
+            padding_x, padding_y = self._calculate_padding(
+                num_cols, num_rows, cell_width, cell_height
+            )
+            self._cancel_solve()
             self._clear_canvas()
 
             self.toggle_button_state("draw", False)
             self.toggle_button_state("solve", False)
             self.set_state(CanvasState.DRAWING)
 
-            cell_cols = 20 if num_cols < 25 else 10
-            cell_rows = 20 if num_rows < 25 else 10
-
             self.maze = Maze(
                 padding_x,
                 padding_y,
                 num_cols=num_cols,
                 num_rows=num_rows,
-                cell_width=cell_cols,
-                cell_height=cell_rows,
+                cell_width=cell_width,
+                cell_height=cell_height,
                 cells=[],
             )
             self.drawer = MazeDrawer(self.maze, self)
@@ -369,25 +511,57 @@ class CanvasFrame(Frame):
             showerror("Error", message=e)
 
     def solve_maze(self, event: Optional[Event] = None):
+        if self._solver_steps is not None:
+            # A solve is already being animated
+            return
         if self.parent_frame.canvas_state in [CanvasState.DRAWING, CanvasState.SOLVING]:
             self._clear_canvas()
         self.set_state(CanvasState.SOLVING)
         if self.drawer and self.maze:
             self.toggle_button_state("draw", False)
             self.toggle_button_state("solve", False)
+            self.toggle_button_state("reset", False)
 
             self.maze_solver = MazeSolver(self.maze, self.drawer)
-
-            self.maze_solver.solve()
-            self._bind_return(self.reset_maze)
+            self._solver_steps = self.maze_solver.steps()
+            self._solve_step()
         else:
             showerror(title="Error", message="Must draw maze before solving it")
+            self._finish_solve()
+
+    def _solve_step(self):
+        """
+        Runs the next move of the solver and paints it. Instead of sleeping
+        between moves, the following one is scheduled with Tk's after so the
+        event loop stays free between frames
+        """
+        self._solve_after_id = None
+        try:
+            next(self._solver_steps)
+        except StopIteration:
+            self._solver_steps = None
+            self.force_flush()
+            self._bind_return(self.reset_maze)
+            self._finish_solve()
+            return
+        self.force_flush()
+        self._solve_after_id = self.after(SOLVE_STEP_MS, self._solve_step)
+
+    def _cancel_solve(self):
+        """Stops an animated solve that is still running, if there is one"""
+        if self._solve_after_id is not None:
+            self.after_cancel(self._solve_after_id)
+            self._solve_after_id = None
+        self._solver_steps = None
+
+    def _finish_solve(self):
         self.set_state(CanvasState.IDLE)
         self.toggle_button_state("draw", True)
         self.toggle_button_state("reset", True)
 
     def reset_maze(self, event: Optional[Event] = None):
-        if hasattr(self, "maze_solver"):
+        self._cancel_solve()
+        if getattr(self, "maze_solver", None) is not None:
             for item in self.maze_solver.solution:
                 self.canvas.delete(item)
             self.maze_solver = None
@@ -397,4 +571,5 @@ class CanvasFrame(Frame):
         self.set_state(CanvasState.IDLE)
         self.toggle_button_state("solve", True)
         self.toggle_button_state("draw", True)
+        self.toggle_button_state("reset", False)
         self._bind_return(self.solve_maze)
@@ -1,35 +1,43 @@
 from unittest import TestCase, mock, main
 from functools import wraps
-from tkinter import Tk, Frame, Entry
+from tkinter import Tk, Entry
 
-from src.screen import App, CanvasFrame
-from src.maze import Maze, Cell, MazeDrawer
+from src.screen import App, CanvasFrame, CanvasState
+from src.maze import Maze, MazeDrawer, MazeSolver, NEIGHBOR_OFFSETS
+from src.cell import WALL_TOP, WALL_BOTTOM
 
 
-def mock_gui_with_setup(func):
+def build_maze(canvas_frame, num_cols=12, num_rows=10, seed=None):
+    """Creates a Maze of 10x10 pixel cells and generates it on canvas_frame"""
+    m = Maze(
+        x_start=0,
+        y_start=0,
+        num_cols=num_cols,
+        num_rows=num_rows,
+        cell_width=10,
+        cell_height=10,
+        cells=[],
+    )
+    md = MazeDrawer(m, canvas_frame, seed=seed)
+    return m, md
+
+
+def mock_gui_with_setup(func=None, **maze_options):
     """
     Decorator to mock certain drawing functionality without opening a new window
     Instantiates Window, Maze and MazeDrawer mock objects for testing
+    Keyword options (num_cols, num_rows, seed) are passed on to build_maze
     """
+    if func is None:
+        return lambda func: mock_gui_with_setup(func, **maze_options)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
         with mock.patch("src.maze.MazeDrawer._animate", lambda *args, **kwargs: None):
             tk = Tk()
             app = App(tk)
-            num_cols = 12
-            num_rows = 10
-            m = Maze(
-                x_start=0,
-                y_start=0,
-                num_cols=num_cols,
-                num_rows=num_rows,
-                cell_width=10,
-                cell_height=10,
-                cells=[],
-            )
-            MazeDrawer(m, app.config.canvas_frame)
-            kwargs.update({"m": m})
+            m, md = build_maze(app.config.canvas_frame, **maze_options)
+            kwargs.update({"m": m, "md": md})
 
             return func(*args, **kwargs)
 
@@ -38,7 +46,7 @@ def mock_gui_with_setup(func):
 
 class MazeTest(TestCase):
     @mock_gui_with_setup
-    def test_maze_create_cells(self, m):
+    def test_maze_create_cells(self, m, md):
         num_cols = 12
         num_rows = 10
         self.assertEqual(
@@ -69,22 +77,153 @@ class MazeTest(TestCase):
             f"Maze with {num_rows} rows and {num_cols} columns, cell size: {cell_width}x{cell_height}",
         )
 
+    def test_cell_format_coords_on_edge(self):
+        m = Maze(
+            x_start=0,
+            y_start=0,
+            num_cols=2,
+            num_rows=2,
+            cell_width=10,
+            cell_height=10,
+            cells=[],
+        )
+        m.init_cells()
+        self.assertEqual(
+            f"{m.get_cell(0, 0):c}",
+            " with the following coordinates:\nX: 5\nY: 5",
+        )
+
+    def test_cell_format_walls(self):
+        m = Maze(
+            x_start=0,
+            y_start=0,
+            num_cols=2,
+            num_rows=2,
+            cell_width=10,
+            cell_height=10,
+            cells=[],
+        )
+        m.init_cells()
+        cell = m.get_cell(0, 0)
+        self.assertEqual(f"{cell:w}", "Cell has 4 walls: top right bottom left ")
+        cell.walls &= ~WALL_TOP
+        self.assertEqual(f"{cell:w}", "Cell has 3 walls: right bottom left ")
+
     @mock_gui_with_setup
-    def test_maze_draw_entrance_and_exit(self, m: Maze):
+    def test_maze_draw_entrance_and_exit(self, m: Maze, md: MazeDrawer):
         top = m.get_cell(0, 0)
         bottom = m.get_cell(
             m.num_cols - 1,
             m.num_rows - 1,
         )
-        self.assertEqual(top.has_top_wall, False)
-        self.assertEqual(bottom.has_bottom_wall, False)
+        self.assertEqual(top.walls & WALL_TOP, 0)
+        self.assertEqual(bottom.walls & WALL_BOTTOM, 0)
 
     @mock_gui_with_setup
-    def test_reset_visited_cells(self, m: Maze):
+    def test_reset_visited_cells(self, m: Maze, md: MazeDrawer):
         for col in m.cells:
             for cell in col:
                 self.assertEqual(cell.visited, False)
 
+    @mock_gui_with_setup(num_cols=50, num_rows=50)
+    def test_solver_reaches_large_exit(self, m: Maze, md: MazeDrawer):
+        # Large enough that a recursive search would hit the recursion limit
+        self.assertTrue(MazeSolver(m, md).solve())
+        self.assertTrue(m.end_cell.visited)
+
+    @mock_gui_with_setup(num_cols=4, num_rows=3, seed=4)
+    def test_solver_reaches_exit(self, m: Maze, md: MazeDrawer):
+        with mock.patch.object(
+            MazeDrawer, "draw_move", autospec=True, side_effect=MazeDrawer.draw_move
+        ) as draw_move:
+            self.assertTrue(MazeSolver(m, md).solve())
+        moves = [call.args[1:] for call in draw_move.call_args_list]
+
+        self.assertIs(moves[0][0], m.start_cell)
+        self.assertIs(moves[-1][1], m.end_cell)
+        for (_, to_cell), (next_cell, _) in zip(moves, moves[1:]):
+            self.assertIs(to_cell, next_cell)
+        for from_cell, to_cell in moves:
+            # Each move crosses an open wall into an adjacent cell
+            for wall, (col_offset, row_offset, opposite) in NEIGHBOR_OFFSETS.items():
+                if (from_cell.col + col_offset, from_cell.row + row_offset) == (
+                    to_cell.col,
+                    to_cell.row,
+                ):
+                    self.assertEqual(from_cell.walls & wall, 0)
+                    self.assertEqual(to_cell.walls & opposite, 0)
+                    break
+            else:
+                self.fail(f"{from_cell!r} is not next to {to_cell!r}")
+        # The seed 4 maze, whose only path to the exit takes 7 moves
+        # +  +--+--+--+
+        # |        |  |
+        # +--+--+  +  +
+        # |  |     |  |
+        # +  +  +--+  +
+        # |           |
+        # +--+--+--+  +
+        self.assertEqual(len(moves), 7)
+
+    @mock_gui_with_setup(seed=4)
+    def test_maze_seed_is_reproducible(self, m: Maze, md: MazeDrawer):
+        other, _ = build_maze(App(Tk()).config.canvas_frame, seed=4)
+        self.assertEqual(m.walls, other.walls)
+
+    def test_wall_region(self):
+        # Drawn walls reach over the corner posts, erased walls stop short of them
+        region = CanvasFrame._wall_region
+        self.assertEqual(region(10, 20, 30, 20, "black"), (9, 19, 31, 21))
+        self.assertEqual(region(30, 20, 10, 20, "white"), (11, 19, 29, 21))
+        self.assertEqual(region(20, 10, 20, 30, "black"), (19, 9, 21, 31))
+        self.assertEqual(region(20, 30, 20, 10, "white"), (19, 11, 21, 29))
+
+    def test_erased_wall_keeps_corner_posts(self):
+        pixels = {}
+
+        def paint(x1, y1, x2, y2, fill_color="black"):
+            left, top, right, bottom = CanvasFrame._wall_region(
+                x1, y1, x2, y2, fill_color
+            )
+            for x in range(left, right):
+                for y in range(top, bottom):
+                    pixels[x, y] = fill_color
+
+        # 2x2 grid of 10px cells, then erase the wall between the top two cells
+        for offset in (10, 20, 30):
+            paint(offset, 10, offset, 30)
+            paint(10, offset, 30, offset)
+        paint(20, 10, 20, 20, "white")
+
+        for post_x, post_y in ((20, 10), (20, 20)):
+            for x in (post_x - 1, post_x):
+                for y in (post_y - 1, post_y):
+                    self.assertEqual(pixels[x, y], "black", (x, y))
+        for y in range(11, 19):
+            self.assertEqual(pixels[19, y], "white")
+            self.assertEqual(pixels[20, y], "white")
+
+    def test_flush_paints_black_before_white(self):
+        app = App(Tk())
+        canvas_frame = app.config.canvas_frame
+        canvas_frame.set_state(CanvasState.DRAWING)
+        canvas_frame.queue_wall(20, 10, 20, 20, "white")
+        canvas_frame.queue_wall(10, 10, 30, 10)
+        canvas_frame.queue_wall(20, 10, 20, 30)
+
+        with mock.patch.object(canvas_frame.canvas, "tk") as tk:
+            canvas_frame.flush()
+        (script,), _ = tk.eval.call_args
+        image = str(canvas_frame.wall_image)
+        self.assertEqual(
+            script.split("\n"),
+            [
+                f"{image} put black -to 9 9 31 11",
+                f"{image} put black -to 19 9 21 31",
+                f"{image} put white -to 19 11 21 19",
+            ],
+        )
+
     def test_canvas_invalid_inputs(self):
         # Creating an App instance
         tk = Tk()